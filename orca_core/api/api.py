@@ -14,7 +14,7 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Union, Tuple
 import numpy as np
 import uvicorn
-from orca_core.utils.yaml_utils import read_yaml, update_yaml
+from orca_core.utils.utils import read_yaml, update_yaml
 
 from orca_core import OrcaHand
 
@@ -241,16 +241,27 @@ def get_motor_temperature():
     except Exception as e:
         handle_hand_exception(e)
 
+@app.get("/joints/ids", summary="Get Joint IDs", tags=["State"])
+def get_joint_ids():
+    """
+    Retrieves the joint names in the order used by /joints/position. The order is fixed by the
+    configuration, so clients only need to fetch it once.
+
+    Returns:
+        dict: Contains the list of joint names: {"joint_ids": [joint1, joint2, ...]}.
+    """
+    return {"joint_ids": hand.joint_ids}
+
 @app.get("/joints/position", summary="Get Joint Positions", tags=["State"])
 def get_joint_position():
     """
-    Retrieves the current position of all calibrated joints.
+    Retrieves the current position of all calibrated joints. Joint names are not repeated in every
+    response, the positions are in the order returned by /joints/ids.
 
     Returns:
-        dict: A dictionary mapping joint names to their positions:
-              {"positions": {"joint1": pos1, "joint2": pos2, ...}}.
-              Returns null for positions if not connected or not calibrated.
+        dict: Contains a list of joint positions: {"positions": [pos1, pos2, ...]}.
               Individual joint values might be null if that specific joint isn't calibrated yet.
+              Responds with 409 if the hand is not connected.
     """
     try:
         j_pos = hand.get_joint_pos()
@@ -7,8 +7,11 @@
 # ==============================================================================
 
 import os
+import sys
 import time
+import atexit
 import math
+import functools
 import threading
 from typing import Dict, List, Union
 from collections import deque
@@ -18,6 +21,22 @@ from .hardware.dynamixel_client import DynamixelClient
 from .hardware.mock_dynamixel_client import MockDynamixelClient
 from .utils.utils import *
 
+def require_connection(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.is_connected():
+            raise RuntimeError("Hand is not connected.")
+        return func(self, *args, **kwargs)
+    return wrapper
+
+def require_calibration(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.calibrated:
+            raise RuntimeError("Hand is not calibrated. Please run .calibrate() first.")
+        return func(self, *args, **kwargs)
+    return wrapper
+
 class OrcaHand:
     """OrcaHand class is used to abtract hardware control the hand of the robot with simple high level control methods in joint space."""
    
@@ -55,8 +74,10 @@ class OrcaHand:
         self.neutral_position: Dict[str, float] = config.get('neutral_position', {})
         
         self.motor_ids: List[int] = config.get('motor_ids', [])
-        self.joint_ids: List[str] = config.get('joint_ids', [])
+        # Joint names are interned, so that names given as literals hit the identity fast path of the dict lookups
+        self.joint_ids: List[str] = [sys.intern(joint) for joint in config.get('joint_ids', [])]
         self.motor_id_to_idx_dict: Dict[int, int] = {motor_id: i for i, motor_id in enumerate(self.motor_ids)}
+        self._motor_ids_array: np.ndarray = np.array(self.motor_ids, dtype=int)
 
         motor_limits_from_calib_dict = calib.get('motor_limits', {})
         self.motor_limits_dict: Dict[int, List[float]] = {
@@ -66,8 +87,8 @@ class OrcaHand:
         self.joint_to_motor_ratios_dict: Dict[int, float] = {
             motor_id: joint_to_motor_ratios_from_calib_dict.get(motor_id, 0.0) for motor_id in self.motor_ids}
             
-        self.joint_to_motor_map: Dict[str, float] = config.get('joint_to_motor_map', {})
-        self.joint_roms_dict: Dict[str, List[float]] = config.get('joint_roms', {})
+        self.joint_to_motor_map: Dict[str, float] = {sys.intern(joint): motor_id for joint, motor_id in config.get('joint_to_motor_map', {}).items()}
+        self.joint_roms_dict: Dict[str, List[float]] = {sys.intern(joint): rom for joint, rom in config.get('joint_roms', {}).items()}
         
         self.joint_inversion_dict = {}
         for joint, motor_id in self.joint_to_motor_map.items():
@@ -91,14 +112,27 @@ class OrcaHand:
         self._task_stop_event = threading.Event()
         self._lock = threading.Lock() 
         self._current_task = None
+
+        # Latest-only slots shared with the stream task, the task always works on the most recent values
+        self._stream_lock = threading.Lock()
+        self._stream_target: np.ndarray = np.full(len(self.motor_ids), np.nan)
+        self._stream_target_dirty: bool = False
+        self._stream_joint_pos: List[float] = None
         
         self._sanity_check()       
+
+        # Per-motor lookup tables in the order of motor_ids, so joint commands can be converted with numpy
+        slot_joints = [self.motor_to_joint_dict[motor_id] for motor_id in self.motor_ids]
+        self._joint_to_idx_dict: Dict[str, int] = {joint: idx for idx, joint in enumerate(slot_joints)}
+        self._joint_rom_min: np.ndarray = np.array([self.joint_roms_dict[joint][0] for joint in slot_joints], dtype=float)
+        self._joint_rom_max: np.ndarray = np.array([self.joint_roms_dict[joint][1] for joint in slot_joints], dtype=float)
+        self._joint_inverted: np.ndarray = np.array([self.joint_inversion_dict[joint] for joint in slot_joints], dtype=bool)
+        self._joint_ids_idx: np.ndarray = np.array([self._joint_to_idx_dict[joint] for joint in self.joint_ids], dtype=np.intp)
+        self._joint_dict_slots_cache: tuple = None
+        self._update_calibration_arrays()
+
         self.is_calibrated(verbose=True)
 
-    def __del__(self):
-        """Destructor to disconnect from the hand."""
-        self.disconnect()
-        
     def connect(self) -> tuple[bool, str]:
         """Connect to the hand with the DynamixelClient.
 
@@ -109,17 +143,21 @@ class OrcaHand:
             self._dxl_client = DynamixelClient(self.motor_ids, self.port, self.baudrate)
             with self._motor_lock:
                 self._dxl_client.connect()
+            atexit.register(self._shutdown)
             return True, "Connection successful"
         except Exception as e:
             self._dxl_client = None
             return False, f"Connection failed: {str(e)}"
         
     def disconnect(self) -> tuple[bool, str]:
-        """Disconnect from the hand.
+        """Disconnect from the hand. A running task is stopped first.
 
         Returns:
             tuple[bool, str]: (Success status, message).
         """
+        if self._task_thread and self._task_thread.is_alive() and self._task_thread is not threading.current_thread():
+            self.stop_task()
+        atexit.unregister(self._shutdown)
         try:
             with self._motor_lock:
                 self.disable_torque()
@@ -129,6 +167,10 @@ class OrcaHand:
         except Exception as e:
             return False, f"Disconnection failed: {str(e)}"
         
+    def _shutdown(self):
+        """Disconnect at interpreter exit, registered with atexit while the hand is connected."""
+        self.disconnect()
+
     def is_connected(self) -> bool:
         """Check if the hand is connected.
 
@@ -137,6 +179,7 @@ class OrcaHand:
         """
         return self._dxl_client.is_connected if self._dxl_client else False
         
+    @require_connection
     def enable_torque(self, motor_ids: List[int] = None):
         """Enable torque for the motors.
         
@@ -148,6 +191,7 @@ class OrcaHand:
         with self._motor_lock:
             self._dxl_client.set_torque_enabled(motor_ids, True)        
 
+    @require_connection
     def disable_torque(self, motor_ids: List[int] = None):
         """Disable torque for the motors.
         
@@ -159,6 +203,7 @@ class OrcaHand:
         with self._motor_lock:
             self._dxl_client.set_torque_enabled(motor_ids, False)
     
+    @require_connection
     def set_max_current(self, current: Union[float, List[float]]):
         """Set the maximum current for the motors.
         
@@ -174,6 +219,7 @@ class OrcaHand:
             with self._motor_lock:
                 self._dxl_client.write_desired_current(self.motor_ids, current*np.ones(len(self.motor_ids)))
         
+    @require_connection
     def set_control_mode(self, mode: str, motor_ids: List[int] = None):
         """Set the control mode for the motors.
         
@@ -207,6 +253,7 @@ class OrcaHand:
                     raise ValueError("Invalid motor IDs.")
             self._dxl_client.set_operating_mode(motor_ids, mode)
             
+    @require_connection
     def get_motor_pos(self, as_dict: bool = False) -> Union[np.ndarray, dict]:
         """Get the current motor positions in radians (Note that this includes offsets of the motors).
         
@@ -223,6 +270,7 @@ class OrcaHand:
                 return {motor_id: pos for motor_id, pos in zip(self.motor_ids, motor_pos)}
             return motor_pos
         
+    @require_connection
     def get_motor_current(self, as_dict: bool = False) -> Union[np.ndarray, dict]:
         """Get the current motor currents in mA.
         
@@ -239,6 +287,7 @@ class OrcaHand:
                 return {motor_id: current for motor_id, current in zip(self.motor_ids, motor_current)}
             return motor_current
         
+    @require_connection
     def get_motor_temp(self, as_dict: bool = False) -> Union[np.ndarray, dict]:
         """Get the current motor temperatures in Celsius.
         
@@ -255,6 +304,7 @@ class OrcaHand:
                 return {motor_id: temp for motor_id, temp in zip(self.motor_ids, motor_temp)}
             return motor_temp
 
+    @require_connection
     def get_joint_pos(self, as_list: bool = True) -> Union[dict, list]:
         """Get the current joint positions.
     
@@ -266,66 +316,56 @@ class OrcaHand:
             Union[dict, list]: Joint positions as a list [position1, position2, ...] in the order of joint_ids
                                or as a dictionary {joint_name: position}.
         """
-        motor_pos = self.get_motor_pos()
-        joint_pos = self._motor_to_joint_pos(motor_pos)
-        if as_list:
-            return [joint_pos[joint] for joint in self.joint_ids]
-    
-        return joint_pos
+        with self._motor_lock:
+            motor_pos = self.get_motor_pos()
+            if as_list:
+                joint_vec = self._motor_to_joint_vec(motor_pos)[self._joint_ids_idx]
+                return [None if math.isnan(pos) else pos for pos in joint_vec.tolist()]
+        
+            return self._motor_to_joint_pos(motor_pos)
          
-    def set_joint_pos(self, joint_pos: Union[dict, list], num_steps: int = 1, step_size: float = 1.0):
+    @require_connection
+    def set_joint_pos(self, joint_pos: Union[dict, list, np.ndarray], num_steps: int = 1, step_size: float = 1.0):
         """Set the desired joint positions. If nun_steps > 1, the hand will move to the target position in a smooth, gradual motion (depending also on step_size).
     
         Args:
-            joint_pos (dict or list): If dict, it should be {joint_name: desired_position}.
-                                    If list, it should contain positions in the order of joint_ids.
+            joint_pos (dict or list or np.ndarray): If dict, it should be {joint_name: desired_position}.
+                                    If list or np.ndarray, it should contain positions in the order of joint_ids.
             num_steps (int): Number of steps to reach the target position. If 1, moves directly to target.
             step_size (float): Time to wait between steps in seconds.
         """
-        
+        # Hold the motor lock for each read-convert-write, so that commands from several threads
+        # (API requests, the stream task) are applied one after another instead of interleaving.
+        # It is released between steps, so that e.g. disable_torque() from another thread is not held off.
+        target_pos = self._joint_pos_to_vec(joint_pos)
+
         if num_steps > 1:
-            current_positions = self.get_joint_pos(as_list=False)
-            
-            if isinstance(joint_pos, list):
-                if len(joint_pos) != len(self.joint_ids):
-                    raise ValueError("Length of joint_pos list must match the number of joint_ids.")
-                target_positions = {joint: pos for joint, pos in zip(self.joint_ids, joint_pos)}
+            with self._motor_lock:
+                current_pos = self._motor_to_joint_vec(self.get_motor_pos())
+
+            # Joints that are not part of the target keep their current position
+            commanded = np.zeros(len(self.motor_ids), dtype=bool)
+            if isinstance(joint_pos, dict):
+                commanded[self._joint_dict_slots(joint_pos)[0]] = True
             else:
-                target_positions = joint_pos.copy()
-            
+                commanded[:] = True
+            target_pos = np.where(commanded, target_pos, current_pos)
+
+            step_pos = np.empty_like(current_pos)
             for step in range(num_steps + 1):
                 t = step / num_steps
-                
-                interpolated_positions = {}
-                for joint in self.joint_ids:
-                    if joint in target_positions:
-                        current_pos = current_positions[joint]
-                        if current_pos is None or target_positions[joint] is None:
-                            interpolated_positions[joint] = None
-                            continue
-                        target_pos = target_positions[joint]
-                        interpolated_positions[joint] = current_pos * (1 - t) + target_pos * t
-                    else:
-                        interpolated_positions[joint] = current_positions[joint]
-                
-                motor_pos = self._joint_to_motor_pos(interpolated_positions)
-                                
-                self._set_motor_pos(motor_pos)
+                np.multiply(current_pos, 1 - t, out=step_pos)
+                step_pos += target_pos * t
+
+                with self._motor_lock:
+                    self._set_motor_pos(self._joint_vec_to_motor_pos(step_pos))
                 if step < num_steps: 
                     time.sleep(step_size)
         else:
-            if isinstance(joint_pos, dict):
-                motor_pos = self._joint_to_motor_pos(joint_pos)
-            elif isinstance(joint_pos, list):
-                if len(joint_pos) != len(self.joint_ids):
-                    raise ValueError("Length of joint_pos list must match the number of joint_ids.")
-                joint_pos_dict = {joint: pos for joint, pos in zip(self.joint_ids, joint_pos)}
-                motor_pos = self._joint_to_motor_pos(joint_pos_dict)
-            else:
-                raise ValueError("joint_pos must be a dict or a list.")
-
-            self._set_motor_pos(motor_pos)
+            with self._motor_lock:
+                self._set_motor_pos(self._joint_vec_to_motor_pos(target_pos))
 
+    @require_connection
     def set_zero_position(self, num_steps: int = 25, step_size: float = 0.001):
         """Set the hand to the zero position by moving all joints simultaneously to their zero positions
         in a smooth, gradual motion.
@@ -336,6 +376,7 @@ class OrcaHand:
         """
         self.set_joint_pos({joint: 0 for joint in self.joint_ids}, num_steps=num_steps, step_size=step_size)
         
+    @require_connection
     def set_neutral_position(self, num_steps: int = 25, step_size: float = 0.001):
         """Set the hand to the neutral position by moving all joints simultaneously to their neutral positions
         in a smooth, gradual motion.
@@ -348,6 +389,7 @@ class OrcaHand:
             raise ValueError("Neutral position is not set. Please set the neutral position in the config.yaml file.")
         self.set_joint_pos(self.neutral_position, num_steps=num_steps, step_size=step_size)
         
+    @require_connection
     def init_joints(self, calibrate: bool = False
                     ):
         """Initialize the joints, enables torque, sets the control mode and sets to the zero position.
@@ -410,6 +452,7 @@ class OrcaHand:
         
         return overall_calibrated
 
+    @require_connection
     def calibrate(self, blocking: bool = True):
         if blocking:
             self._calibrate()
@@ -427,6 +470,7 @@ class OrcaHand:
                 motor_id = self.joint_to_motor_map[joint]
                 motor_limits[motor_id] = [None, None]
                 self._wrap_offsets_dict[motor_id] = 0.0
+        self._update_calibration_arrays()
 
         # Set calibration control mode
         self.set_control_mode('current_based_position')
@@ -439,7 +483,7 @@ class OrcaHand:
             if self._task_stop_event.is_set():
                 return
 
-            desired_increment, motor_reached_limit, directions, position_buffers, motor_reached_limit, calibrated_joints, position_logs, current_log = {}, {}, {}, {}, {}, {}, {}, {}
+            desired_increment, motor_reached_limit, directions, position_buffers, motor_reached_limit, calibrated_joints, average_limit = {}, {}, {}, {}, {}, {}, {}
 
             for joint, direction in step["joints"].items(): 
 
@@ -460,10 +504,11 @@ class OrcaHand:
                 if self.joint_inversion_dict.get(joint, False):
                     sign = -sign
                 directions[motor_id] = sign
+                # Only the latest calib_num_stable samples are needed to detect the hardstop
                 position_buffers[motor_id] = deque(maxlen=self.calib_num_stable)
-                position_logs[motor_id] = []
-                current_log[motor_id] = []
                 motor_reached_limit[motor_id] = False
+                # Wrist and abduction joints keep torque at the limit, decided once per motor instead of in the loop
+                average_limit[motor_id] = 'wrist' in joint or 'abd' in joint
 
 
 
@@ -480,14 +525,12 @@ class OrcaHand:
                 for motor_id in desired_increment.keys():
                     if not motor_reached_limit[motor_id]:
                         position_buffers[motor_id].append(curr_pos[self.motor_id_to_idx_dict[motor_id]])
-                        position_logs[motor_id].append(float(curr_pos[self.motor_id_to_idx_dict[motor_id]]))
-                        current_log[motor_id].append(float(self.get_motor_current()[self.motor_id_to_idx_dict[motor_id]]))
 
                         # Check if buffer is full and all values are close
                         if len(position_buffers[motor_id]) == self.calib_num_stable and np.allclose(position_buffers[motor_id], position_buffers[motor_id][0], atol=self.calib_threshold):
                             motor_reached_limit[motor_id] = True
                             # disable torque for the motor
-                            if 'wrist' in joint or 'abd' in joint:
+                            if average_limit[motor_id]:
                                 avg_limit = float(np.mean(position_buffers[motor_id]))
                             else:
                                 self.disable_torque([motor_id])
@@ -514,6 +557,7 @@ class OrcaHand:
             update_yaml(self.calib_path, 'joint_to_motor_ratios', self.joint_to_motor_ratios_dict)
             update_yaml(self.calib_path, 'motor_limits', motor_limits)
             self.motor_limits_dict = motor_limits
+            self._update_calibration_arrays()
             if calibrated_joints:
                 self.set_joint_pos(calibrated_joints, num_steps=25, step_size=0.001)
             time.sleep(0.1)    
@@ -538,6 +582,7 @@ class OrcaHand:
                 motor_id = self.joint_to_motor_map[joint]
                 motor_limits[motor_id] = [None, None]
                 self._wrap_offsets_dict[motor_id] = 0.0
+        self._update_calibration_arrays()
 
         for i, step in enumerate(self.calib_sequence, start=1):
             for joint, _ in step["joints"].items():
@@ -583,6 +628,7 @@ class OrcaHand:
                 print()
 
         self.motor_limits_dict.update(motor_limits)
+        self._update_calibration_arrays()
         update_yaml(self.calib_path, 'motor_limits', self.motor_limits_dict)
         update_yaml(self.calib_path, 'joint_to_motor_ratios', self.joint_to_motor_ratios_dict)
 
@@ -609,31 +655,50 @@ class OrcaHand:
 
         motor_pos = self.get_motor_pos()
 
-        lower_limit = np.array([self.motor_limits_dict[motor_id][0] for motor_id in self.motor_ids])
-        higher_limit = np.array([self.motor_limits_dict[motor_id][1] for motor_id in self.motor_ids])
+        lower_limit, higher_limit = self._motor_lower_limit, self._motor_higher_limit
 
-        offsets = {}
-        for i, motor_id in enumerate(self.motor_ids):
-            if lower_limit[i] is None or higher_limit[i] is None:
-                offsets[motor_id] = 0.0
-                continue
+        # Some buffer to compensate for noise/slack differences. Motors without limits get no offset.
+        has_limits = ~np.isnan(lower_limit) & ~np.isnan(higher_limit)
+        below = has_limits & (motor_pos < lower_limit - 0.25 * np.pi)
+        above = has_limits & (motor_pos > higher_limit + 0.25 * np.pi)
 
-            if motor_pos[i] < lower_limit[i] - 0.25 * np.pi: # Some buffer to compensate for noise/slack differences
-                print(f"Motor ID {motor_id} is out of bounds: "
-                    f"{lower_limit[i]} < {motor_pos[i]} < {higher_limit[i]}")
-                offsets[motor_id] = -2 * np.pi
+        for i in np.flatnonzero(below | above):
+            print(f"Motor ID {self.motor_ids[i]} is out of bounds: "
+                f"{lower_limit[i]} < {motor_pos[i]} < {higher_limit[i]}")
 
-            elif motor_pos[i] > higher_limit[i] + 0.25 * np.pi: # Some buffer to compensate for noise/slack differences
-                print(f"Motor ID {motor_id} is out of bounds: "
-                    f"{lower_limit[i]} < {motor_pos[i]} < {higher_limit[i]}")
-                offsets[motor_id] = +2 * np.pi
-
-            else:
-                offsets[motor_id] = 0.0
+        offsets = dict(zip(self.motor_ids, np.where(below, -2 * np.pi, np.where(above, 2 * np.pi, 0.0)).tolist()))
 
         print(f"Offsets: {offsets}")
 
         self._wrap_offsets_dict = offsets
+        self._update_calibration_arrays()
+
+    def _update_calibration_arrays(self):
+        """Mirror the calibration (motor limits, joint-to-motor ratios and wrap offsets) into numpy arrays
+        in the order of motor_ids. Has to be called whenever one of the underlying dicts changes.
+        """
+        # Readers convert under the motor lock, so they never see a half updated set of arrays
+        with self._motor_lock:
+            lower_limit = [self.motor_limits_dict[motor_id][0] for motor_id in self.motor_ids]
+            higher_limit = [self.motor_limits_dict[motor_id][1] for motor_id in self.motor_ids]
+            ratios = [self.joint_to_motor_ratios_dict[motor_id] for motor_id in self.motor_ids]
+            offsets = self._wrap_offsets_dict or {}
+
+            self._motor_lower_limit = np.array([np.nan if limit is None else limit for limit in lower_limit], dtype=float)
+            self._motor_higher_limit = np.array([np.nan if limit is None else limit for limit in higher_limit], dtype=float)
+            self._joint_to_motor_ratios = np.array([0.0 if ratio is None else ratio for ratio in ratios], dtype=float)
+            self._wrap_offsets = np.array([offsets.get(motor_id, 0.0) for motor_id in self.motor_ids], dtype=float)
+            self._motor_calibrated = np.array(
+                [lo is not None and hi is not None for lo, hi in zip(lower_limit, higher_limit)], dtype=bool) & (self._joint_to_motor_ratios != 0)
+            self._uncalibrated_warned = np.zeros(len(self.motor_ids), dtype=bool)
+
+            # The joint-to-motor mapping is affine per motor: motor_pos = scale * joint_pos + bias.
+            # Inverted: higher ROM value corresponds to lower motor position. Uncalibrated motors map to NaN.
+            scale = np.where(self._joint_inverted, -self._joint_to_motor_ratios, self._joint_to_motor_ratios)
+            rom_origin = np.where(self._joint_inverted, self._joint_rom_max, self._joint_rom_min)
+            bias = self._motor_lower_limit - scale * rom_origin + self._wrap_offsets
+            self._joint_to_motor_scale = np.where(self._motor_calibrated, scale, np.nan)
+            self._joint_to_motor_bias = np.where(self._motor_calibrated, bias, np.nan)
 
     def _set_motor_pos(self, desired_pos: Union[dict, np.ndarray, list], rel_to_current: bool = False):
         """Set the desired motor positions in radians.
@@ -646,7 +711,8 @@ class OrcaHand:
             rel_to_current (bool): If True, the desired position is relative to the current position.
         """
         with self._motor_lock:
-            current_positions = self.get_motor_pos() # np.ndarray of all motor positions
+            # Only read back from the bus if the command is relative, absolute writes don't need a round trip
+            current_positions = self.get_motor_pos() if rel_to_current else None # np.ndarray of all motor positions
 
             motor_ids_to_write = []
             positions_to_write = []
@@ -680,23 +746,20 @@ class OrcaHand:
                         f"must match the number of configured motor_ids ({len(self.motor_ids)})."
                     )
                 
-                for i, pos_val in enumerate(desired_pos):
-                    if pos_val is None or math.isnan(pos_val):
-                        continue
-                    else:
-                        motor_ids_to_write.append(self.motor_ids[i])
-                        current_pos_of_motor = current_positions[i]
-                        if rel_to_current:
-                            positions_to_write.append(float(pos_val) + current_pos_of_motor)
-                        else:
-                            positions_to_write.append(float(pos_val))
-                
-                if not motor_ids_to_write:
+                if isinstance(desired_pos, list):
+                    desired_pos = [np.nan if pos_val is None else pos_val for pos_val in desired_pos]
+                positions = np.asarray(desired_pos, dtype=float)
+                valid = ~np.isnan(positions)
+
+                if not valid.any():
                     print("Info: All positions in desired_pos (list/array) were None. No motor commands sent.")
                     return
 
-                motor_ids_to_write = motor_ids_to_write
-                positions_to_write = np.array(positions_to_write, dtype=float)
+                if rel_to_current:
+                    positions = positions + current_positions
+
+                motor_ids_to_write = self._motor_ids_array[valid].tolist()
+                positions_to_write = positions[valid]
             
             else:
                 raise ValueError("desired_pos must be a dict, np.ndarray, or list.")
@@ -712,26 +775,83 @@ class OrcaHand:
         Returns:
             dict: {joint_name: position}
         """
+        joint_vec = self._motor_to_joint_vec(motor_pos)
+        return {self.motor_to_joint_dict[motor_id]: None if math.isnan(pos) else pos #TODO: Add a warning here the probably the motor is not calibrated
+                for motor_id, pos in zip(self.motor_ids, joint_vec.tolist())}
+
+    def _motor_to_joint_vec(self, motor_pos: np.ndarray) -> np.ndarray:
+        """Convert motor positions into joint positions in the order of motor_ids.
+
+        Args:
+            motor_pos (np.ndarray): Motor positions.
+
+        Returns:
+            np.ndarray: Joint positions in the order of motor_ids. Uncalibrated joints are NaN.
+        """
         if self._wrap_offsets_dict is None:
             self._compute_wrap_offsets_dict()
 
-        joint_pos = {}
-        for idx, pos in enumerate(motor_pos):
-            motor_id = self.motor_ids[idx]
-            joint_name = self.motor_to_joint_dict.get(motor_id)
-            if any(limit is None for limit in self.motor_limits_dict[motor_id]):
-                joint_pos[joint_name] = None #TODO: Add a warning here the probably the motor is not calibrated
-            elif self.joint_to_motor_ratios_dict[motor_id] == 0:
-                joint_pos[joint_name] = None #TODO: Add a warning here the probably the motor is not calibrated
-            else:
-                wrapped_pos = pos - self._wrap_offsets_dict.get(motor_id, 0.0)
-                
-                if self.joint_inversion_dict.get(joint_name, False):
-                    joint_pos[joint_name] = self.joint_roms_dict[joint_name][1] - (wrapped_pos - self.motor_limits_dict[motor_id][0]) / self.joint_to_motor_ratios_dict[motor_id]
-                else:
-                    joint_pos[joint_name] = self.joint_roms_dict[joint_name][0] + (wrapped_pos - self.motor_limits_dict[motor_id][0]) / self.joint_to_motor_ratios_dict[motor_id]
-        return joint_pos
-    
+        joint_vec = np.subtract(motor_pos, self._joint_to_motor_bias, dtype=float)
+        joint_vec /= self._joint_to_motor_scale
+        return joint_vec
+
+    def _joint_pos_to_vec(self, joint_pos: Union[dict, list, np.ndarray]) -> np.ndarray:
+        """Convert joint positions as accepted by set_joint_pos into a vector in the order of motor_ids.
+
+        Args:
+            joint_pos (dict or list or np.ndarray): {joint_name: position} or positions in the order of joint_ids.
+
+        Returns:
+            np.ndarray: Joint positions in the order of motor_ids. Missing or None positions are NaN.
+        """
+        if isinstance(joint_pos, dict):
+            return self._joint_dict_to_vec(joint_pos)
+
+        if isinstance(joint_pos, (list, np.ndarray)):
+            if len(joint_pos) != len(self.joint_ids):
+                raise ValueError("Length of joint_pos list must match the number of joint_ids.")
+            joint_vec = np.full(len(self.motor_ids), np.nan)
+            if isinstance(joint_pos, list):
+                joint_pos = [np.nan if pos is None else pos for pos in joint_pos]
+            joint_vec[self._joint_ids_idx] = joint_pos
+            return joint_vec
+
+        raise ValueError("joint_pos must be a dict, a list or a np.ndarray.")
+
+    def _joint_dict_slots(self, joint_pos: dict) -> tuple[np.ndarray, np.ndarray]:
+        """Look up the motor slots of the joints in joint_pos. Callers usually send the same joints in the
+        same order every time, so the lookup is cached for the last seen key order.
+
+        Args:
+            joint_pos (dict): {joint_name: position}.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (Slots of the known joints, mask of the known joints in joint_pos).
+        """
+        keys = tuple(joint_pos)
+        cache = self._joint_dict_slots_cache
+        if cache is not None and cache[0] == keys:
+            return cache[1], cache[2]
+
+        idx = np.fromiter((self._joint_to_idx_dict.get(joint, -1) for joint in keys), dtype=np.intp, count=len(keys))
+        known = idx >= 0
+        self._joint_dict_slots_cache = (keys, idx[known], known) # Single assignment, safe to share between threads
+        return idx[known], known
+
+    def _joint_dict_to_vec(self, joint_pos: dict) -> np.ndarray:
+        """Scatter joint positions into a vector in the order of motor_ids.
+
+        Args:
+            joint_pos (dict): {joint_name: position}. Unknown joints are ignored.
+
+        Returns:
+            np.ndarray: Joint positions in the order of motor_ids. Missing or None positions are NaN.
+        """
+        slots, known = self._joint_dict_slots(joint_pos)
+        joint_vec = np.full(len(self.motor_ids), np.nan)
+        joint_vec[slots] = np.array(list(joint_pos.values()), dtype=float)[known] # None becomes NaN
+        return joint_vec
+
     def _joint_to_motor_pos(self, joint_pos: dict) -> np.ndarray:
         """Convert desired joint positions into motor commands.
     
@@ -739,37 +859,35 @@ class OrcaHand:
             joint_pos (dict): {joint_name: desired_position}
 
         Returns:
-            np.ndarray: Motor positions.
+            np.ndarray: Motor positions in the order of motor_ids. Motors without a valid command are NaN.
+        """
+        return self._joint_vec_to_motor_pos(self._joint_dict_to_vec(joint_pos))
+
+    def _joint_vec_to_motor_pos(self, joint_vec: np.ndarray) -> np.ndarray:
+        """Convert desired joint positions given in the order of motor_ids into motor commands.
+
+        Args:
+            joint_vec (np.ndarray): Joint positions in the order of motor_ids. NaN entries are not commanded.
+
+        Returns:
+            np.ndarray: Motor positions in the order of motor_ids. Motors without a valid command are NaN.
         """
         if self._wrap_offsets_dict is None:
             self._compute_wrap_offsets_dict()
 
-        motor_pos = [None] * len(self.get_motor_pos())
-                
-        for joint_name, pos in joint_pos.items():
-            motor_id = self.joint_to_motor_map.get(joint_name)
-            if motor_id is None or pos is None:
-                motor_pos[self.motor_id_to_idx_dict[motor_id]] = None
-                continue
-
-            if self.motor_limits_dict[motor_id][0] is None or self.motor_limits_dict[motor_id][1] is None or self.joint_to_motor_ratios_dict[motor_id] == 0:
-                motor_pos[self.motor_id_to_idx_dict[motor_id]] = None
-                print(f"\033[93mWarning: Motor ID {motor_id} (Joint: {joint_name}) has not been fully calibrated (missing joint-to-motor ratio).\033[0m")
-                continue
-            
-            min_pos, max_pos = self.joint_roms_dict[joint_name]
-            
-            if pos < min_pos or pos > max_pos:
-                clipped_pos = max(min_pos, min(max_pos, pos))
-                pos = clipped_pos
-
-            if self.joint_inversion_dict.get(joint_name, False):
-                # Inverted: higher ROM value corresponds to lower motor position.
-                motor_pos[self.motor_id_to_idx_dict[motor_id]] = self.motor_limits_dict[motor_id][0] + (self.joint_roms_dict[joint_name][1] - pos) * self.joint_to_motor_ratios_dict[motor_id]
-            else:
-                motor_pos[self.motor_id_to_idx_dict[motor_id]] = self.motor_limits_dict[motor_id][0] + (pos - self.joint_roms_dict[joint_name][0]) * self.joint_to_motor_ratios_dict[motor_id]  
-            
-            motor_pos[self.motor_id_to_idx_dict[motor_id]] += self._wrap_offsets_dict.get(motor_id, 0.0)
+        commanded = ~np.isnan(joint_vec)
+        # Warn only once per motor, this runs for every command that is sent to the hand
+        uncalibrated = commanded & ~self._motor_calibrated & ~self._uncalibrated_warned
+        if uncalibrated.any():
+            self._uncalibrated_warned |= uncalibrated
+            for i in np.flatnonzero(uncalibrated):
+                motor_id = self.motor_ids[i]
+                print(f"\033[93mWarning: Motor ID {motor_id} (Joint: {self.motor_to_joint_dict[motor_id]}) has not been fully calibrated (missing joint-to-motor ratio).\033[0m")
+
+        # NaN entries (not commanded or not calibrated) propagate through the clip and the affine map
+        motor_pos = np.clip(joint_vec, self._joint_rom_min, self._joint_rom_max)
+        motor_pos *= self._joint_to_motor_scale
+        motor_pos += self._joint_to_motor_bias
             
         return motor_pos
     
@@ -814,6 +932,7 @@ class OrcaHand:
                 self.calibrated = False
                 update_yaml(self.calib_path, 'calibrated', False)
 
+    @require_connection
     def tension(self, move_motors: bool = False, blocking: bool = True):
         if blocking:
             self._tension(move_motors)
@@ -865,6 +984,72 @@ class OrcaHand:
         finally:
             self.disable_torque()  
 
+    @require_connection
+    def stream(self, frequency: float = 50.0, blocking: bool = False):
+        """Continuously send the latest target set with set_stream_target to the hand and read back the
+        joint positions, so that callers never block on the hardware. Stop it with stop_task().
+
+        Args:
+            frequency (float): Update rate in Hz.
+            blocking (bool): If True, run in the calling thread until stopped.
+        """
+        if blocking:
+            self._run_blocking_task(self._stream, frequency)
+        else:
+            self._start_task(self._stream, frequency)
+
+    def set_stream_target(self, joint_pos: Union[dict, list, np.ndarray]):
+        """Set the joint positions the stream task sends next. Targets set within one tick are merged, so
+        the latest position of every commanded joint is sent. Joints that are missing or None are left as they are.
+
+        Args:
+            joint_pos (dict or list or np.ndarray): If dict, it should be {joint_name: desired_position}.
+                                    If list or np.ndarray, it should contain positions in the order of joint_ids.
+        """
+        target = self._joint_pos_to_vec(joint_pos)
+        with self._stream_lock:
+            np.copyto(self._stream_target, target, where=~np.isnan(target))
+            self._stream_target_dirty = True
+
+    def get_stream_joint_pos(self) -> List[float]:
+        """Get the joint positions most recently read by the stream task.
+
+        Returns:
+            list: Joint positions in the order of joint_ids, or None if nothing has been read yet.
+        """
+        with self._stream_lock:
+            return self._stream_joint_pos
+
+    def _stream(self, frequency: float = 50.0):
+        period = 1.0 / frequency
+        target = np.full(len(self.motor_ids), np.nan)
+        next_time = time.monotonic()
+
+        while not self._task_stop_event.is_set():
+            # Only write to the bus if a new target arrived since the last tick
+            with self._stream_lock:
+                send_target = self._stream_target_dirty
+                if send_target:
+                    np.copyto(target, self._stream_target)
+                    self._stream_target.fill(np.nan)
+                    self._stream_target_dirty = False
+
+            if send_target:
+                with self._motor_lock:
+                    self._set_motor_pos(self._joint_vec_to_motor_pos(target))
+
+            joint_pos = self.get_joint_pos()
+            with self._stream_lock:
+                self._stream_joint_pos = joint_pos
+
+            # One clock read per tick, used both for the deadline and for resynchronizing
+            now = time.monotonic()
+            next_time += period
+            if next_time > now:
+                self._task_stop_event.wait(next_time - now)
+            else:
+                next_time = now # Fell behind, don't try to catch up with a burst of writes
+
     def _run_task(self, task_fn, *args, **kwargs):
         """Run a task in a separate thread, so that it can be stopped externally.
         
@@ -893,9 +1078,28 @@ class OrcaHand:
             print(f"Task '{self._current_task}' is already running.")
             return
 
-        self._task_thread = threading.Thread(target=self._run_task, args=(task_fn,) + args, kwargs=kwargs)
+        # Daemon thread, so that a task left running does not block interpreter exit before _shutdown stops it
+        self._task_thread = threading.Thread(target=self._run_task, args=(task_fn,) + args, kwargs=kwargs, daemon=True)
         self._task_thread.start()
 
+    def _run_blocking_task(self, task_fn, *args, **kwargs):
+        """Run a task in the calling thread, so that it can still be stopped externally with stop_task().
+        
+        Args:
+            task_fn (function): The task function to run.
+            *args: Additional arguments to pass to the task function.
+            **kwargs: Additional keyword arguments to pass to the task function.
+        """
+        if self._task_thread and self._task_thread.is_alive():
+            print(f"Task '{self._current_task}' is already running.")
+            return
+
+        self._task_thread = threading.current_thread()
+        try:
+            self._run_task(task_fn, *args, **kwargs)
+        finally:
+            self._task_thread = None
+
     def stop_task(self):
         """Stop the currently running task.
         """
@@ -906,20 +1110,6 @@ class OrcaHand:
         else:
             print("No running task to stop.")               
 
-def require_connection(func):
-    def wrapper(self, *args, **kwargs):
-        if not self._dxl_client.is_connected():
-            raise RuntimeError("Hand is not connected.")
-        return func(self, *args, **kwargs)
-    return wrapper
-
-def require_calibration(func):
-    def wrapper(self, *args, **kwargs):
-        if not self.calibrated:
-            raise RuntimeError("Hand is not calibrated. Please run .calibrate() first.")
-        return func(self, *args, **kwargs)
-    return wrapper
-
 
 class MockOrcaHand(OrcaHand):
     """MockOrcaHand class is used to simulate the OrcaHand class for testing."""
@@ -935,6 +1125,7 @@ class MockOrcaHand(OrcaHand):
             self._dxl_client = MockDynamixelClient(self.motor_ids, self.port, self.baudrate)
             with self._motor_lock:
                 self._dxl_client.connect()
+            atexit.register(self._shutdown)
             return True, "Mock connection successful"
         except Exception as e:
             self._dxl_client = None
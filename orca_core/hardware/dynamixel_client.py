@@ -440,7 +440,7 @@ class DynamixelReader:
             try:
                 self._update_data(i, motor_id)
             except Exception as e:
-                logging.error(f'Error updating data for motor {motor_id}: {e}')
+                logging.error('Error updating data for motor %d: %s', motor_id, e)
                 errored_ids.append(motor_id)
                 continue
 
@@ -15,38 +15,14 @@ import random
 from typing import Optional, Sequence, Union, Tuple
 import numpy as np
 
-PROTOCOL_VERSION = 2.0
-
-ADDR_OPERATING_MODE = 11
-ADDR_TORQUE_ENABLE = 64
-ADDR_GOAL_POSITION = 116
-ADDR_GOAL_PWM = 100
-ADDR_GOAL_CURRENT = 102
-ADDR_PROFILE_VELOCITY = 112
-ADDR_PRESENT_POSITION = 132
-ADDR_PRESENT_VELOCITY = 128
-ADDR_PRESENT_CURRENT = 126
-ADDR_PRESENT_POS_VEL_CUR = 126
-ADDR_MOVING_STATUS = 123
-ADDR_PRESENT_TEMPERATURE = 146
-
-# Data Byte Length
-LEN_OPERATING_MODE = 1
-LEN_PRESENT_POSITION = 4
-LEN_PRESENT_VELOCITY = 4
-LEN_PRESENT_CURRENT = 2
-LEN_PRESENT_POS_VEL_CUR = 10
-LEN_GOAL_POSITION = 4
-LEN_GOAL_PWM = 2
-LEN_GOAL_CURRENT = 2
-LEN_PROFILE_VELOCITY = 4
-LEN_MOVING_STATUS = 1
-LEN_PRESENT_TEMPERATURE = 1
-
-DEFAULT_POS_SCALE = 2.0 * np.pi / 4096  # 0.088 degrees
-# See http://emanual.robotis.com/docs/en/dxl/x/xh430-v210/#goal-velocity
-DEFAULT_VEL_SCALE = 0.229 * 2.0 * np.pi / 60.0  # 0.229 rpm
-DEFAULT_CUR_SCALE = 1.34
+# Share the protocol constants and the register reader with the real client instead of keeping a copy
+from .dynamixel_client import (
+    PROTOCOL_VERSION,
+    DEFAULT_POS_SCALE,
+    DEFAULT_VEL_SCALE,
+    DEFAULT_CUR_SCALE,
+    DynamixelPosVelCurReader,
+)
 
 
 def dynamixel_cleanup_handler():
@@ -59,23 +35,6 @@ def dynamixel_cleanup_handler():
         open_client.disconnect()
 
 
-def signed_to_unsigned(value: int, size: int) -> int:
-    """Converts the given value to its unsigned representation."""
-    if value < 0:
-        bit_size = 8 * size
-        max_value = (1 << bit_size) - 1
-        value = max_value + value
-    return value
-
-
-def unsigned_to_signed(value: int, size: int) -> int:
-    """Converts the given value from its unsigned representation."""
-    bit_size = 8 * size
-    if (value & (1 << (bit_size - 1))) != 0:
-        value = -((1 << bit_size) - value)
-    return value
-
-
 class MockDynamixelClient:
     """Mock client for simulating communication with Dynamixel motors.
 
@@ -244,16 +203,12 @@ class MockDynamixelClient:
         """
         assert len(motor_ids) == len(positions)
                 
-        for mid in motor_ids:
+        # Simulate the hardstops
+        positions = np.clip(np.asarray(positions, dtype=float), self._min_pos, self._max_motor_pos)
+        for mid, pos in zip(motor_ids, positions.tolist()):
             if mid not in self._pos:
                 raise ValueError('Motor ID {} not found in client.'.format(mid))
-            
-            if positions[motor_ids.index(mid)] > self._max_motor_pos:
-                self._pos[mid] = self._max_motor_pos
-            elif positions[motor_ids.index(mid)] < self._min_pos:
-                self._pos[mid] = self._min_pos
-            else:
-                self._pos[mid] = positions[motor_ids.index(mid)]
+            self._pos[mid] = pos
         
         times = [0.0]
         for _ in range(4):
@@ -348,136 +303,6 @@ class MockDynamixelClient:
         self.disconnect()
 
 
-class DynamixelReader:
-    """Reads data from Dynamixel motors.
-
-    This wraps a GroupBulkRead from the DynamixelSDK.
-    """
-
-    def __init__(self, client: MockDynamixelClient, motor_ids: Sequence[int],
-                 address: int, size: int):
-        """Initializes a new reader."""
-        self.client = client
-        self.motor_ids = motor_ids
-        self.address = address
-        self.size = size
-        self._initialize_data()
-
-        self.operation = self.client.dxl.GroupBulkRead(client.port_handler,
-                                                       client.packet_handler)
-
-        for motor_id in motor_ids:
-            success = self.operation.addParam(motor_id, address, size)
-            if not success:
-                raise OSError(
-                    '[Motor ID: {}] Could not add parameter to bulk read.'
-                    .format(motor_id))
-
-    def read(self, retries: int = 1):
-        """Reads data from the motors."""
-        self.client.check_connected()
-        success = False
-        while not success and retries >= 0:
-            comm_result = self.operation.txRxPacket()
-            success = self.client.handle_packet_result(
-                comm_result, context='read')
-            retries -= 1
-
-        # If we failed, send a copy of the previous data.
-        if not success:
-            return self._get_data()
-
-        errored_ids = []
-        for i, motor_id in enumerate(self.motor_ids):
-            # Check if the data is available.
-            available = self.operation.isAvailable(motor_id, self.address,
-                                                   self.size)
-            if not available:
-                errored_ids.append(motor_id)
-                continue
-
-            self._update_data(i, motor_id)
-
-        if errored_ids:
-            logging.error('Bulk read data is unavailable for: %s',
-                          str(errored_ids))
-
-        return self._get_data()
-
-    def _initialize_data(self):
-        """Initializes the cached data."""
-        self._data = np.zeros(len(self.motor_ids), dtype=np.float32)
-
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        self._data[index] = self.operation.getData(motor_id, self.address,
-                                                   self.size)
-
-    def _get_data(self):
-        """Returns a copy of the data."""
-        return self._data.copy()
-
-
-class DynamixelPosVelCurReader(DynamixelReader):
-    """Reads positions and velocities."""
-
-    def __init__(self,
-                 client: MockDynamixelClient,
-                 motor_ids: Sequence[int],
-                 pos_scale: float = 1.0,
-                 vel_scale: float = 1.0,
-                 cur_scale: float = 1.0):
-        super().__init__(
-            client,
-            motor_ids,
-            address=ADDR_PRESENT_POS_VEL_CUR,
-            size=LEN_PRESENT_POS_VEL_CUR,
-        )
-        self.pos_scale = pos_scale
-        self.vel_scale = vel_scale
-        self.cur_scale = cur_scale
-
-    def _initialize_data(self):
-        """Initializes the cached data."""
-        self._pos_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-        self._vel_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-        self._cur_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        cur = self.operation.getData(motor_id, ADDR_PRESENT_CURRENT,
-                                     LEN_PRESENT_CURRENT)
-        vel = self.operation.getData(motor_id, ADDR_PRESENT_VELOCITY,
-                                     LEN_PRESENT_VELOCITY)
-        pos = self.operation.getData(motor_id, ADDR_PRESENT_POSITION,
-                                     LEN_PRESENT_POSITION)
-        cur = unsigned_to_signed(cur, size=2)
-        vel = unsigned_to_signed(vel, size=4)
-        pos = unsigned_to_signed(pos, size=4)
-        self._pos_data[index] = float(pos) * self.pos_scale
-        self._vel_data[index] = float(vel) * self.vel_scale
-        self._cur_data[index] = float(cur) * self.cur_scale
-
-    def _get_data(self):
-        """Returns a copy of the data."""
-        return (self._pos_data.copy(), self._vel_data.copy(),
-                self._cur_data.copy())
-
-class DynamixelTempReader(DynamixelReader):
-    """Reads present temperature (1 byte) for each Dynamixel motor."""
-    
-    def _initialize_data(self):
-        # We'll store one float per motor for the temperature values.
-        self._temp_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-
-    def _update_data(self, index: int, motor_id: int):
-        # The raw value from the control table is 1 byte = 1 degree Celsius.
-        raw_val = self.operation.getData(motor_id, self.address, self.size)
-        self._temp_data[index] = float(raw_val)
-
-    def _get_data(self):
-        return self._temp_data.copy()
-
 # Register global cleanup function.
 atexit.register(dynamixel_cleanup_handler)
 
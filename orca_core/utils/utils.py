@@ -7,6 +7,7 @@
 # ==============================================================================
 
 import os
+import functools
 import yaml
 import numpy as np
 
@@ -14,17 +15,22 @@ import numpy as np
 ### Model path utils ##########################################################
 ################################################################################
 
+@functools.lru_cache(maxsize=1)
+def _default_model_path():
+    """Scan the bundled models directory once per process, the result doesn't change at runtime."""
+    models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
+    if not os.path.exists(models_dir):
+        raise FileNotFoundError("\033[1;35mModels directory not found. Did you delete them?")
+    model_dirs = [d for d in os.listdir(models_dir) if os.path.isdir(os.path.join(models_dir, d))]
+    model_dirs = sorted(model_dirs, key=lambda x: (x.lower() != 'right', x))
+    if len(model_dirs) == 0:
+        raise FileNotFoundError("\033[1;35mNo model files found. Did you delete them?")
+    return os.path.join(models_dir, model_dirs[0])
+
 def get_model_path(model_path=None):
 
     if model_path is None or model_path == "models":
-        models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
-        if not os.path.exists(models_dir):
-            raise FileNotFoundError("\033[1;35mModels directory not found. Did you delete them?")
-        model_dirs = [d for d in os.listdir(models_dir) if os.path.isdir(os.path.join(models_dir, d))]
-        model_dirs = sorted(model_dirs, key=lambda x: (x.lower() != 'right', x))
-        if len(model_dirs) == 0:
-            raise FileNotFoundError("\033[1;35mNo model files found. Did you delete them?")
-        resolved_path = os.path.join(models_dir, model_dirs[0])
+        resolved_path = _default_model_path()
     else:
         if os.path.isabs(model_path):
             resolved_path = model_path # Absolute path provided
@@ -1,4 +1,5 @@
 from orca_core import OrcaHand
+import time
 import numpy as np
 import argparse # Added import
 
@@ -99,6 +100,7 @@ def main(): # Added main function
     # Perform the movement in a loop
     try:
         while True:
+            start_time = time.time()
             for t_idx, t in enumerate(time_steps):
                 # Combine all joint positions for this time step
                 current_positions = {}
@@ -109,6 +111,12 @@ def main(): # Added main function
                 # Send the positions to the hand
                 hand.set_joint_pos(current_positions)
 
+                # Wait only if ahead of schedule instead of busy-looping on the bus
+                target_time = start_time + (t_idx + 1) * step_time
+                now = time.time()
+                if now < target_time:
+                    time.sleep(target_time - now)
+
     except KeyboardInterrupt:
         # Reset the hand to the neutral position on exit
         hand.set_joint_pos({joint: 0 for joint in hand.joint_ids})
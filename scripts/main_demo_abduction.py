@@ -100,6 +100,7 @@ def main(): # Added main function
     # Perform the movement in a loop
     try:
         while True:
+            start_time = time.time()
             for t_idx, t in enumerate(time_steps):
                 # Combine all joint positions for this time step
                 current_positions = {}
@@ -109,7 +110,12 @@ def main(): # Added main function
                 
                 # Send the positions to the hand
                 hand.set_joint_pos(current_positions)
-                time.sleep(step_time)
+
+                # Wait only if ahead of schedule instead of drifting by the time spent on the bus
+                target_time = start_time + (t_idx + 1) * step_time
+                now = time.time()
+                if now < target_time:
+                    time.sleep(target_time - now)
 
     except KeyboardInterrupt:
         # Reset the hand to the neutral position on exit
@@ -1,24 +1,10 @@
 import time
 import yaml
-import numpy as np
 import argparse
 from orca_core import OrcaHand
+from orca_core.utils.utils import linear_interp, ease_in_out
 import os
 
-def linear_interp(t):
-    return t
-
-def ease_in_out(t):
-    return 0.5 * (1 - np.cos(np.pi * t))
-
-def interpolate_waypoints(start, end, duration, step_time, mode="linear"):
-    n_steps = int(duration / step_time)
-    interp_func = linear_interp if mode == "linear" else ease_in_out
-    for i in range(n_steps + 1):
-        t = i / n_steps
-        alpha = interp_func(t)
-        yield [(1 - alpha) * s + alpha * e for s, e in zip(start, end)]
-
 def main():
     parser = argparse.ArgumentParser(description='Replay recorded hand movements')
     parser.add_argument('--step_time', type=float, default=0.02,
@@ -0,0 +1,49 @@
+import unittest
+import tempfile
+import shutil
+from fastapi.testclient import TestClient
+from orca_core import MockOrcaHand
+from orca_core.api import api
+from tests.test_joint_pos import make_calibrated_model
+
+class TestOrcaHandAPI(unittest.TestCase):
+    def setUp(self):
+        """Replace the API's hand with a mock hand that has a synthetic calibration."""
+        self.temp_dir = tempfile.mkdtemp()
+        make_calibrated_model(self.temp_dir)
+        self.original_hand = api.hand
+        self.hand = MockOrcaHand(self.temp_dir)
+        api.hand = self.hand
+        self.client = TestClient(api.app)
+
+    def tearDown(self):
+        if self.hand.is_connected():
+            self.hand.disconnect()
+        api.hand = self.original_hand
+        shutil.rmtree(self.temp_dir)
+
+    def test_joint_ids(self):
+        """/joints/ids should return the joint names in the order of joint_ids, also when not connected."""
+        response = self.client.get("/joints/ids")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"joint_ids": self.hand.joint_ids})
+
+    def test_joint_position_order(self):
+        """/joints/position should return positions in the order given by /joints/ids."""
+        self.hand.connect()
+        self.hand.set_joint_pos({'index_mcp': 30, 'thumb_mcp': -10})
+
+        joint_ids = self.client.get("/joints/ids").json()["joint_ids"]
+        response = self.client.get("/joints/position")
+        self.assertEqual(response.status_code, 200)
+        positions = dict(zip(joint_ids, response.json()["positions"]))
+        self.assertAlmostEqual(positions['index_mcp'], 30, places=3)
+        self.assertAlmostEqual(positions['thumb_mcp'], -10, places=3)
+
+    def test_joint_position_not_connected(self):
+        """/joints/position should respond with 409 if the hand is not connected."""
+        response = self.client.get("/joints/position")
+        self.assertEqual(response.status_code, 409)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,27 @@ class TestOrcaCore(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to connect MockOrcaHand: {e}")
 
+    def test_commands_require_connection(self):
+        mock_hand = MockOrcaHand()
+        with self.assertRaises(RuntimeError):
+            mock_hand.set_joint_pos({joint: 0 for joint in mock_hand.joint_ids})
+        with self.assertRaises(RuntimeError):
+            mock_hand.get_joint_pos()
+        with self.assertRaises(RuntimeError):
+            mock_hand.set_zero_position()
+        with self.assertRaises(RuntimeError):
+            mock_hand.set_neutral_position()
+        with self.assertRaises(RuntimeError):
+            mock_hand.init_joints()
+        # The non-blocking paths should fail in the caller instead of starting a task thread
+        with self.assertRaises(RuntimeError):
+            mock_hand.calibrate(blocking=False)
+        with self.assertRaises(RuntimeError):
+            mock_hand.tension(blocking=False)
+        with self.assertRaises(RuntimeError):
+            mock_hand.stream()
+        self.assertIsNone(mock_hand._task_thread)
+
 if __name__ == "__main__":
     unittest.main()
     
@@ -0,0 +1,219 @@
+import unittest
+import tempfile
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from unittest import mock
+import numpy as np
+from orca_core import MockOrcaHand
+from orca_core.utils import read_yaml, update_yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_DIR = os.path.join(REPO_ROOT, "orca_core", "models", "orcahand_v1_right")
+REAL_CONFIG = os.path.join(MODEL_DIR, "config.yaml")
+
+MOTOR_LIMITS = [-1.0, 1.0]
+
+def make_calibrated_model(model_dir):
+    """Copy the right hand config into model_dir and add a synthetic calibration for the mock motors."""
+    config_path = os.path.join(model_dir, "config.yaml")
+    calib_path = os.path.join(model_dir, "calibration.yaml")
+    shutil.copy(REAL_CONFIG, config_path)
+
+    config = read_yaml(config_path)
+    motor_to_joint = {abs(int(motor_id)): joint for joint, motor_id in config['joint_to_motor_map'].items()}
+    ratios = {}
+    for motor_id in config['motor_ids']:
+        rom = config['joint_roms'][motor_to_joint[motor_id]]
+        ratios[motor_id] = (MOTOR_LIMITS[1] - MOTOR_LIMITS[0]) / (rom[1] - rom[0])
+    update_yaml(calib_path, 'joint_to_motor_ratios', ratios)
+    update_yaml(calib_path, 'motor_limits', {motor_id: list(MOTOR_LIMITS) for motor_id in config['motor_ids']})
+    update_yaml(calib_path, 'calibrated', True)
+
+class TestOrcaHandJointPos(unittest.TestCase):
+    def setUp(self):
+        """Set up a connected mock hand with a synthetic calibration."""
+        self.temp_dir = tempfile.mkdtemp()
+        make_calibrated_model(self.temp_dir)
+
+        self.hand = MockOrcaHand(self.temp_dir)
+        success, msg = self.hand.connect()
+        self.assertTrue(success, f"Failed to connect mock hand: {msg}")
+
+    def tearDown(self):
+        self.hand.disconnect()
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Joint positions that are set should be read back."""
+        self.hand.set_joint_pos(self.hand.neutral_position)
+        joint_pos = self.hand.get_joint_pos(as_list=False)
+        for joint, pos in self.hand.neutral_position.items():
+            rom_min, rom_max = self.hand.joint_roms_dict[joint]
+            expected = min(max(pos, rom_min), rom_max)
+            self.assertAlmostEqual(joint_pos[joint], expected, places=3, msg=f"Joint {joint} did not reach its target")
+
+    def test_out_of_rom_is_clipped(self):
+        """Targets outside the ROM should be clipped to the ROM limits."""
+        self.hand.set_joint_pos({'index_mcp': 1000, 'thumb_mcp': -1000})
+        joint_pos = self.hand.get_joint_pos(as_list=False)
+        self.assertAlmostEqual(joint_pos['index_mcp'], self.hand.joint_roms_dict['index_mcp'][1], places=3)
+        self.assertAlmostEqual(joint_pos['thumb_mcp'], self.hand.joint_roms_dict['thumb_mcp'][0], places=3)
+
+    def test_partial_command(self):
+        """Joints that are missing, None or unknown should not be commanded."""
+        self.hand.set_joint_pos({joint: 0 for joint in self.hand.joint_ids})
+        before = self.hand.get_joint_pos(as_list=False)
+        self.hand.set_joint_pos({'index_pip': 50, 'middle_pip': None, 'not_a_joint': 10})
+        after = self.hand.get_joint_pos(as_list=False)
+        self.assertAlmostEqual(after['index_pip'], 50, places=3)
+        for joint in self.hand.joint_ids:
+            if joint != 'index_pip':
+                self.assertAlmostEqual(after[joint], before[joint], places=3, msg=f"Joint {joint} should not have moved")
+
+    def test_list_command_with_steps(self):
+        """A list in the order of joint_ids should be reached when moving in several steps."""
+        self.hand.set_joint_pos({joint: 0 for joint in self.hand.joint_ids})
+        target = [10.0] * len(self.hand.joint_ids)
+        self.hand.set_joint_pos(target, num_steps=5, step_size=0.0)
+        for joint, pos in zip(self.hand.joint_ids, self.hand.get_joint_pos()):
+            self.assertAlmostEqual(pos, 10.0, places=3, msg=f"Joint {joint} did not reach its target")
+
+    def test_array_command(self):
+        """A np.ndarray in the order of joint_ids should be accepted like a list."""
+        target = np.full(len(self.hand.joint_ids), -5.0)
+        self.hand.set_joint_pos(target)
+        for joint, pos in zip(self.hand.joint_ids, self.hand.get_joint_pos()):
+            self.assertAlmostEqual(pos, -5.0, places=3, msg=f"Joint {joint} did not reach its target")
+
+    def test_key_order_change(self):
+        """Commands with the same joints in a different order should map to the right motors."""
+        self.hand.set_joint_pos({'index_mcp': 30, 'middle_mcp': 60})
+        self.hand.set_joint_pos({'middle_mcp': 10, 'index_mcp': 20})
+        joint_pos = self.hand.get_joint_pos(as_list=False)
+        self.assertAlmostEqual(joint_pos['index_mcp'], 20, places=3)
+        self.assertAlmostEqual(joint_pos['middle_mcp'], 10, places=3)
+
+    def test_lock_released_between_steps(self):
+        """Other threads should get to the bus between the steps of an interpolated move."""
+        in_step_sleep = threading.Event()
+        resume_move = threading.Event()
+
+        def step_sleep(seconds):
+            in_step_sleep.set()
+            resume_move.wait(timeout=5)
+
+        move = threading.Thread(target=self.hand.set_joint_pos, args=({'index_mcp': 30},),
+                                kwargs={'num_steps': 4, 'step_size': 0.25})
+        with mock.patch('orca_core.core.time.sleep', side_effect=step_sleep):
+            move.start()
+            self.assertTrue(in_step_sleep.wait(timeout=5), "The move never reached its first step")
+
+            # The move is paused between steps, so the bus must be free for another thread
+            torque_disabled = threading.Event()
+            other = threading.Thread(target=lambda: (self.hand.disable_torque(), torque_disabled.set()))
+            other.start()
+            self.assertTrue(torque_disabled.wait(timeout=5), "disable_torque() waited for the whole move")
+            self.assertTrue(move.is_alive())
+
+            resume_move.set()
+            move.join(timeout=5)
+            other.join(timeout=5)
+        self.assertFalse(move.is_alive())
+
+class TestOrcaHandStream(unittest.TestCase):
+    def setUp(self):
+        """Set up a connected mock hand with a synthetic calibration."""
+        self.temp_dir = tempfile.mkdtemp()
+        make_calibrated_model(self.temp_dir)
+        self.hand = MockOrcaHand(self.temp_dir)
+        success, msg = self.hand.connect()
+        self.assertTrue(success, f"Failed to connect mock hand: {msg}")
+
+    def tearDown(self):
+        self.hand.stop_task()
+        self.hand.disconnect()
+        shutil.rmtree(self.temp_dir)
+
+    def test_stream_sends_latest_target(self):
+        """The stream task should drive the hand to the latest target and report it back."""
+        self.hand.stream(frequency=200.0)
+        self.assertTrue(self.hand._task_thread.is_alive())
+        self.hand.set_stream_target({joint: 0 for joint in self.hand.joint_ids})
+        self.hand.set_stream_target({'index_mcp': 40})
+        time.sleep(0.1)
+
+        joint_pos = self.hand.get_stream_joint_pos()
+        self.assertIsNotNone(joint_pos)
+        for joint, pos in zip(self.hand.joint_ids, joint_pos):
+            expected = 40 if joint == 'index_mcp' else 0
+            self.assertAlmostEqual(pos, expected, places=3, msg=f"Joint {joint} did not reach its target")
+
+        self.hand.stop_task()
+        self.assertFalse(self.hand._task_thread.is_alive())
+
+    def test_blocking_stream(self):
+        """A blocking stream should run after an earlier stop_task() and be stopped by stop_task()."""
+        self.hand.stream(frequency=200.0)
+        self.hand.stop_task()
+
+        self.hand.set_stream_target({'index_mcp': 40})
+        stream = threading.Thread(target=self.hand.stream, kwargs={'frequency': 200.0, 'blocking': True})
+        stream.start()
+        for _ in range(500):
+            joint_pos = self.hand.get_stream_joint_pos()
+            if stream.is_alive() and joint_pos is not None and abs(joint_pos[self.hand.joint_ids.index('index_mcp')] - 40) < 1e-3:
+                break
+            time.sleep(0.01)
+        self.assertTrue(stream.is_alive(), "Blocking stream returned without being stopped")
+        self.assertAlmostEqual(joint_pos[self.hand.joint_ids.index('index_mcp')], 40, places=3)
+
+        self.hand.stop_task()
+        stream.join(timeout=5)
+        self.assertFalse(stream.is_alive(), "stop_task() did not stop the blocking stream")
+        self.assertIsNone(self.hand._task_thread)
+
+    def test_partial_targets_are_merged(self):
+        """Partial targets set before the stream task runs should all be sent."""
+        self.hand.set_joint_pos({joint: 0 for joint in self.hand.joint_ids})
+        self.hand.set_stream_target({'thumb_mcp': 20})
+        self.hand.set_stream_target({'index_mcp': 40})
+        self.hand.set_stream_target({'thumb_mcp': 25, 'middle_mcp': None})
+        self.hand.stream(frequency=200.0)
+        time.sleep(0.1)
+
+        joint_pos = self.hand.get_stream_joint_pos()
+        self.assertIsNotNone(joint_pos)
+        for joint, pos in zip(self.hand.joint_ids, joint_pos):
+            expected = {'thumb_mcp': 25, 'index_mcp': 40}.get(joint, 0)
+            self.assertAlmostEqual(pos, expected, places=3, msg=f"Joint {joint} did not reach its target")
+
+    def test_disconnect_while_streaming(self):
+        """disconnect() should stop a running stream before closing the client."""
+        with mock.patch('threading.excepthook') as excepthook:
+            self.hand.stream(frequency=200.0)
+            stream = self.hand._task_thread
+            success, msg = self.hand.disconnect()
+            stream.join(timeout=5)
+        self.assertTrue(success, msg)
+        self.assertFalse(stream.is_alive())
+        self.assertFalse(self.hand.is_connected())
+        excepthook.assert_not_called()
+
+    def test_exit_with_stream_running(self):
+        """A script that returns with the stream still running should stop it and exit."""
+        script = (
+            "from orca_core import MockOrcaHand\n"
+            f"hand = MockOrcaHand({self.temp_dir!r})\n"
+            "hand.connect()\n"
+            "hand.stream(frequency=200.0)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Task stopped.", result.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,5 +55,14 @@ class TestOrcaHandTension(unittest.TestCase):
         time.sleep(0.1)
         self.assertFalse(self.hand._task_thread.is_alive())
 
+    def test_disconnect_stops_tension(self):
+        """Disconnecting while tensioning should stop the task before the client is closed."""
+        self.hand.tension(move_motors=False, blocking=False)
+        task_thread = self.hand._task_thread
+        success, msg = self.hand.disconnect()
+        self.assertTrue(success, msg)
+        self.assertFalse(task_thread.is_alive(), "Tension task should have stopped")
+        self.assertIsNone(self.hand._current_task)
+
 if __name__ == '__main__':
     unittest.main()